@@ -224,6 +224,12 @@ Address: 4ABC...XYZ
     print("  ✓ Extracts 25-word seed phrase from output")
     print(f"  ✓ Seed: {seed[:30]}...")
     
+    # A 25-token label line is not mistaken for the seed itself
+    words = [f"word{n}" for n in range(1, 26)]
+    labelled_output = "Your seed: " + " ".join(words[:23]) + "\n" + " ".join(words) + "\n"
+    assert extract_seed_from_output(labelled_output) == " ".join(words), "Should skip the seed label line"
+    print("  ✓ Ignores the line that labels the seed")
+    
     print("\n✅ TEST 6: WalletCreationError Exception")
     print("-" * 70)
     
@@ -80,7 +80,7 @@ def test_wait_for_rpc_ready_function():
     
     checks = [
         ('def wait_for_rpc_ready(port=18083, max_wait=60, retry_interval=2)', 'Function signature'),
-        ('requests.post', 'HTTP POST request'),
+        ('_RPC_SESSION.post', 'HTTP POST request'),
         ('get_height', 'RPC method call'),
         ('response.status_code == 200', 'Success check'),
         ('requests.ConnectionError', 'Connection error handling'),
@@ -206,7 +206,7 @@ def test_wait_for_ready_improvements():
         ('self.rpc_process.poll()', 'Checks if process is still alive'),
         ('if self.rpc_process and self.rpc_process.poll() is not None', 'Detects dead process'),
         ('logger.error(f"❌ RPC process died', 'Reports process death'),
-        ('requests.post', 'Tests RPC connection'),
+        ('self._session.post', 'Tests RPC connection'),
         ('time.sleep(2)', 'Waits between retries'),
         ('attempt} attempts', 'Tracks attempt count'),
     ]
@@ -119,7 +119,7 @@ def test_node_connection_test_method():
         ('def test_node_connection(self', 'Method definition'),
         ('daemon_address: Optional[str]', 'Optional daemon address parameter'),
         ('daemon_port: Optional[int]', 'Optional daemon port parameter'),
-        ('requests.post(url, json=', 'HTTP POST request'),
+        ('_DAEMON_SESSION.post(url, json=', 'HTTP POST request'),
         ('"method": "get_info"', 'RPC get_info method'),
         ("'success':", 'Success field in return dict'),
         ("'block_height':", 'Block height field in return dict'),
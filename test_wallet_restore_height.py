@@ -23,7 +23,7 @@ def test_get_blockchain_height():
     
     checks = [
         ('def get_current_blockchain_height(daemon_address: str, daemon_port: int)', 'Function signature'),
-        ('requests.get', 'HTTP GET request'),
+        ('_DAEMON_SESSION.get', 'HTTP GET request'),
         ('/get_height', 'Get height endpoint'),
         ('response.json().get("height")', 'Parse height from response'),
         ('return height', 'Return height value'),
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Test wallet setup performance changes:
+- Streaming monero-wallet-cli output parsing
+- monero-wallet-cli resolved once on PATH
+- Backoff polling while waiting on processes
+- Early wake-up when the wallet RPC exits
+- Concurrent node connectivity probes
+- Short-lived cache of node connection checks
+- Sync monitor gives up on a persistently failing RPC
+- Sync progress logged at most once per update interval
+- Sync status check that doesn't block startup
+"""
+
+import sys
+import os
+import re
+import socket
+import stat
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add signalbot to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+SEED = " ".join(["abbey"] * 24 + ["absorb"])
+ADDRESS = "4" + "A" * 94
+NOISE = "4" + "0" * 94
+
+
+def _install_fake_cli(bin_dir: str, exit_code: int = 0, color: bool = False):
+    """Create a fake monero-wallet-cli that prints a seed and address"""
+    script = os.path.join(bin_dir, "monero-wallet-cli")
+    on, off = ("\\033[1;32m", "\\033[0m") if color else ("", "")
+    with open(script, "w") as f:
+        f.write("#!/bin/sh\n")
+        f.write("echo 'Generating new wallet...'\n")
+        f.write("echo 'Your wallet seed is:'\n")
+        f.write(f"printf '{on}{SEED}{off}\\n'\n")
+        # Log noise that starts with 4 and is 95 characters long
+        f.write(f"echo '{NOISE}'\n")
+        f.write(f"printf '{on}{ADDRESS}{off}\\n'\n")
+        f.write(f"exit {exit_code}\n")
+    os.chmod(script, os.stat(script).st_mode | stat.S_IEXEC)
+
+
+def _make_manager(tmpdir: str):
+    from signalbot.core.wallet_setup import WalletSetupManager
+    return WalletSetupManager(
+        wallet_path=os.path.join(tmpdir, "shop_wallet"),
+        daemon_address="localhost",
+        daemon_port=18081,
+    )
+
+
+def _create_wallet_with_fake_cli(exit_code: int = 0, color: bool = False):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _install_fake_cli(tmpdir, exit_code=exit_code, color=color)
+        manager = _make_manager(tmpdir)
+        env_path = tmpdir + os.pathsep + os.environ.get("PATH", "")
+        # The CLI is looked up on PATH again when it wasn't found at import
+        with patch.dict(os.environ, {"PATH": env_path}), \
+             patch("signalbot.core.wallet_setup._WALLET_CLI", None), \
+             patch("signalbot.core.wallet_setup.get_current_blockchain_height", return_value=None):
+            start = time.monotonic()
+            result = manager.create_wallet()
+            return result, time.monotonic() - start
+
+
+def test_create_wallet_parses_streamed_output():
+    """Seed and address are captured from the CLI output"""
+    (success, address, seed), _ = _create_wallet_with_fake_cli()
+    assert success
+    assert address == ADDRESS
+    assert seed == SEED
+
+
+def test_create_wallet_ignores_color_codes():
+    """Seed and address wrapped in ANSI colour codes are still captured"""
+    (success, address, seed), _ = _create_wallet_with_fake_cli(color=True)
+    assert success
+    assert address == ADDRESS
+    assert seed == SEED
+
+
+def test_create_wallet_fails_on_cli_error_exit():
+    """A CLI that fails after printing seed and address is still a failure"""
+    from signalbot.core.wallet_setup import WalletCreationError
+    
+    try:
+        _create_wallet_with_fake_cli(exit_code=1)
+        assert False, "create_wallet should raise WalletCreationError"
+    except WalletCreationError as e:
+        assert "Wallet creation failed" in str(e)
+
+
+def test_create_wallet_fails_fast_without_cli():
+    """A missing monero-wallet-cli is reported before contacting the daemon"""
+    from signalbot.core.wallet_setup import WalletCreationError
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = _make_manager(tmpdir)
+        with patch("signalbot.core.wallet_setup._WALLET_CLI", None), \
+             patch("signalbot.core.wallet_setup.shutil.which", return_value=None), \
+             patch("signalbot.core.wallet_setup.get_current_blockchain_height") as mock_height:
+            try:
+                manager.create_wallet()
+                assert False, "create_wallet should raise WalletCreationError"
+            except WalletCreationError as e:
+                assert "monero-wallet-cli not found" in str(e)
+            assert not mock_height.called
+
+
+def test_poll_with_backoff_returns_early():
+    """Polling stops as soon as the condition holds and honours the budget"""
+    from signalbot.core.wallet_setup import _poll_with_backoff
+    
+    calls = []
+    start = time.monotonic()
+    assert _poll_with_backoff(lambda: calls.append(1) or len(calls) >= 3, budget=5.0)
+    assert len(calls) == 3
+    assert time.monotonic() - start < 1.0
+    
+    start = time.monotonic()
+    assert not _poll_with_backoff(lambda: False, budget=0.3)
+    assert time.monotonic() - start < 1.0
+
+
+def test_sleep_unless_exited_wakes_on_exit():
+    """Waiting on a process returns as soon as it exits"""
+    from signalbot.core.wallet_setup import _sleep_unless_exited
+    
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.2)"])
+    start = time.monotonic()
+    assert _sleep_unless_exited(process, 10)
+    assert time.monotonic() - start < 5
+    
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(10)"])
+    try:
+        assert not _sleep_unless_exited(process, 0.2)
+    finally:
+        process.kill()
+        process.wait()
+
+
+def test_node_connectivity_keeps_order():
+    """Working nodes are returned in the order they were given"""
+    from signalbot.core import wallet_setup
+    
+    listeners = []
+    for _ in range(2):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        sock.listen(1)
+        listeners.append(sock)
+    
+    # Grab a free port and close it so nothing is listening there
+    closed = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    closed.bind(("127.0.0.1", 0))
+    closed_port = closed.getsockname()[1]
+    closed.close()
+    
+    try:
+        first, second = (("127.0.0.1", s.getsockname()[1]) for s in listeners)
+        nodes = [second, ("127.0.0.1", closed_port), first]
+        with patch.dict(wallet_setup._NODE_PROBE_CACHE, clear=True):
+            assert wallet_setup.test_node_connectivity(nodes) == [second, first]
+            assert wallet_setup.test_node_connectivity([]) == []
+    finally:
+        for sock in listeners:
+            sock.close()
+
+
+def test_node_connectivity_reuses_recent_successes():
+    """Reachable nodes are trusted within the TTL; unreachable ones are probed again"""
+    from signalbot.core import wallet_setup
+    
+    nodes = [("node-a.example", 18081), ("node-b.example", 18089)]
+    with patch.dict(wallet_setup._NODE_PROBE_CACHE, clear=True), \
+         patch("signalbot.core.wallet_setup._probe_node", side_effect=lambda address, port: address == "node-a.example") as mock_probe:
+        assert wallet_setup.test_node_connectivity(nodes) == [nodes[0]]
+        assert wallet_setup.test_node_connectivity(nodes) == [nodes[0]]
+        assert [c.args for c in mock_probe.call_args_list].count(nodes[0]) == 1
+        assert [c.args for c in mock_probe.call_args_list].count(nodes[1]) == 2
+
+
+def test_node_connection_reuses_recent_result():
+    """Repeat checks of the same node within the TTL skip the daemon call"""
+    from signalbot.core import wallet_setup
+    
+    response = Mock(status_code=200)
+    response.json.return_value = {"result": {"height": 3000000, "nettype": "mainnet"}}
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = _make_manager(tmpdir)
+        with patch.dict(wallet_setup._NODE_INFO_CACHE, clear=True), \
+             patch.object(wallet_setup._DAEMON_SESSION, "post", return_value=response) as mock_post:
+            first = manager.test_node_connection()
+            second = manager.test_node_connection()
+            assert first["success"] and second["block_height"] == 3000000
+            assert mock_post.call_count == 1
+            
+            # A different node is probed separately
+            manager.test_node_connection(daemon_port=18089)
+            assert mock_post.call_count == 2
+
+
+def test_sync_monitor_gives_up_on_persistent_errors():
+    """Back-to-back RPC failures end the monitor once the error budget is spent"""
+    import requests
+    from signalbot.core import wallet_setup
+    
+    with patch.object(wallet_setup, "SYNC_MONITOR_MAX_ERROR_WAIT", 30.0), \
+         patch.object(wallet_setup._RPC_SESSION, "post", side_effect=requests.ConnectionError("refused")) as mock_post, \
+         patch("signalbot.core.wallet_setup._sleep_unless_exited", return_value=False):
+        assert wallet_setup.monitor_sync_progress(port=1, update_interval=10) is False
+        # 0.5 + 1 + 2 + 4 + 8 + 10 + 10 (with jitter) exceeds 30s within a few calls
+        assert mock_post.call_count < 10
+
+
+def test_sync_monitor_limits_progress_logging():
+    """Fast polling during a quick sync still logs progress once per update_interval"""
+    from signalbot.core import wallet_setup
+    
+    clock = [1000.0]
+    heights = [3000000 + 1000 * min(n, 40) for n in range(60)]
+    
+    def reply(*args, **kwargs):
+        response = Mock(status_code=200)
+        response.json.return_value = {"result": {"height": heights.pop(0)}}
+        return response
+    
+    def fake_sleep(process, seconds):
+        clock[0] += seconds
+        return False
+    
+    with patch.object(wallet_setup._RPC_SESSION, "post", side_effect=reply), \
+         patch("signalbot.core.wallet_setup._sleep_unless_exited", side_effect=fake_sleep), \
+         patch("signalbot.core.wallet_setup.time.monotonic", side_effect=lambda: clock[0]), \
+         patch.object(wallet_setup.logger, "info") as mock_info:
+        start = clock[0]
+        assert wallet_setup.monitor_sync_progress(port=1, update_interval=10) is True
+    
+    progress = [c.args[0] for c in mock_info.call_args_list if "Syncing wallet" in c.args[0]]
+    # No rate computed against height 0 on the first reading
+    assert all(int(m) < 1000000 for line in progress for m in re.findall(r"\+(\d+) blocks", line))
+    assert len(progress) <= (clock[0] - start) / 10 + 2
+
+
+def test_sync_check_does_not_block_startup():
+    """Sync state is decided without waiting for the wallet height to move"""
+    import requests
+    from signalbot.core import wallet_setup
+    
+    def reply(height):
+        response = Mock(status_code=200)
+        response.json.return_value = {"result": {"height": height}}
+        return response
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = _make_manager(tmpdir)
+        for wallet_height, syncing in ((2999999, False), (2900000, True)):
+            with patch.object(manager._session, "post", return_value=reply(wallet_height)) as mock_rpc, \
+                 patch.object(wallet_setup._DAEMON_SESSION, "post", return_value=reply(3000001)), \
+                 patch("signalbot.core.wallet_setup.time.sleep") as mock_sleep, \
+                 patch("signalbot.core.wallet_setup.threading.Thread") as mock_thread:
+                manager._check_and_monitor_sync()
+                assert not mock_sleep.called
+                assert mock_rpc.call_count == 1
+                assert mock_thread.called == syncing
+        
+        # Daemon unreachable: the background monitor decides, startup doesn't wait
+        with patch.object(manager._session, "post", return_value=reply(3000000)), \
+             patch.object(wallet_setup._DAEMON_SESSION, "post", side_effect=requests.ConnectionError("refused")), \
+             patch("signalbot.core.wallet_setup.time.sleep") as mock_sleep, \
+             patch("signalbot.core.wallet_setup.threading.Thread") as mock_thread:
+            manager._check_and_monitor_sync()
+            assert not mock_sleep.called
+            assert mock_thread.called
+        
+        # Wallet RPC too busy to answer in time: the monitor still starts
+        with patch.object(manager._session, "post", side_effect=requests.Timeout("busy")), \
+             patch("signalbot.core.wallet_setup.threading.Thread") as mock_thread:
+            manager._check_and_monitor_sync()
+            assert mock_thread.called
+
+
+def main():
+    tests = [
+        test_create_wallet_parses_streamed_output,
+        test_create_wallet_ignores_color_codes,
+        test_create_wallet_fails_on_cli_error_exit,
+        test_create_wallet_fails_fast_without_cli,
+        test_poll_with_backoff_returns_early,
+        test_sleep_unless_exited_wakes_on_exit,
+        test_node_connectivity_keeps_order,
+        test_node_connectivity_reuses_recent_successes,
+        test_node_connection_reuses_recent_result,
+        test_sync_monitor_gives_up_on_persistent_errors,
+        test_sync_monitor_limits_progress_logging,
+        test_sync_check_does_not_block_startup,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS - {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAIL - {test.__name__}: {e}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())